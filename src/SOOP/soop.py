@@ -1,5 +1,8 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from src.model import Types, Manifest
+from src.util import util
 
 VOD_API = "https://api.m.sooplive.co.kr/station/video/a/view"
 LOGIN_API = "https://login.sooplive.co.kr/app/LoginAction.php"
@@ -19,6 +22,18 @@ HEADERS = {
     "Origin": "https://play.sooplive.co.kr",
 }
 
+# Connection Pool & Retry
+POOL_CONNECTIONS = 8
+POOL_MAXSIZE = 32
+RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(["GET"]),
+)
+# VOD 정보 조회는 읽기 전용이므로 POST 요청이어도 다시 시도합니다. 로그인 요청은 다시 보내지 않습니다.
+VOD_API_RETRY = RETRY.new(allowed_methods=frozenset(["GET", "POST"]))
+
 # Login Status
 LOGGED_IN = 1
 LOGGED_OUT = -1
@@ -35,17 +50,33 @@ class SOOP:
         if cls.__session is None:
             cls.__session = requests.Session()
             cls.__session.headers.update(HEADERS)
+            adapter = HTTPAdapter(
+                pool_connections=POOL_CONNECTIONS,
+                pool_maxsize=POOL_MAXSIZE,
+                max_retries=RETRY,
+            )
+            cls.__session.mount("https://", adapter)
+            cls.__session.mount("http://", adapter)
+            cls.__session.mount(
+                VOD_API,
+                HTTPAdapter(pool_maxsize=POOL_MAXSIZE, max_retries=VOD_API_RETRY),
+            )
         return cls.__session
 
     @classmethod
     def check_auth(cls) -> bool:
         """
         세션이 SOOP에 로그인되어 있는지 확인합니다.
+        쿠키가 없는 세션은 로그인되어 있을 수 없으므로 확인 요청을 보내지 않습니다.
         """
+        session = cls.session()
+        if len(session.cookies) == 0:
+            return False
+
         try:
-            res = cls.session().get(CHECK_API, timeout=4)
+            res = session.get(CHECK_API, timeout=4)
             res.raise_for_status()
-            return res.json()["CHANNEL"]["IS_LOGIN"] == LOGGED_IN
+            return util.loads_json(res.content)["CHANNEL"]["IS_LOGIN"] == LOGGED_IN
         except:
             return False
 
@@ -92,7 +123,7 @@ class SOOP:
         except requests.exceptions.RequestException as e:
             msg = f"서버에 연결할 수 없습니다 - {e}"
 
-        match response.json().get("RESULT", 1024):
+        match util.loads_json(response.content).get("RESULT", 1024):
             case 1:
                 return cls.check_auth()
             case -1:
@@ -130,7 +161,10 @@ class SOOP:
         except requests.exceptions.RequestException as e:
             msg = f"서버에 연결할 수 없습니다 - {e}"
 
-        if response.status_code == 200 and response.json().get("RESULT", 0) == 1:
+        if (
+            response.status_code == 200
+            and util.loads_json(response.content).get("RESULT", 0) == 1
+        ):
             return True
         else:
             msg = "2차 인증에 실패했습니다."
@@ -153,6 +187,7 @@ class SOOP:
     def get_manifest(cls, url: str, quality: str | None = None) -> Manifest:
         """
         VOD 정보를 요청하고, 원하는 품질의 URL 매니페스트를 반환합니다.\n
+        모든 구간에 같은 해상도를 사용하며, 원하는 품질이 없으면 모든 구간에 있는 가장 높은 품질을 사용합니다.\n
         매니페스트가 비었거나 파싱에 실패하면 KeyError를 발생시킵니다.\n
         유효하지 않은 URL이라면 ValueError를 발생시킵니다.
 
@@ -175,9 +210,10 @@ class SOOP:
                 "nApiLevel": "10",
                 "nPlaylistidx": "0",
             },
+            timeout=10,
         )
         res.raise_for_status()
-        data: dict = res.json().get("data", None)
+        data: dict = util.loads_json(res.content).get("data", None)
 
         if (quality == "auto" or quality is None or quality == "자동") or (
             quality not in QUALITY_MAPPING
@@ -186,11 +222,25 @@ class SOOP:
         elif quality in QUALITY_MAPPING:
             desired_quality = quality
 
-        objlist = data["files"]
-        for file_dict in objlist:
+        target = _height(desired_quality[:-1])
+        parts = []
+        for file_dict in data["files"]:
+            by_height = {}
             for fileset in file_dict["quality_info"]:
-                if str(fileset["resolution"]).split("x")[-1] == desired_quality[:-1]:
-                    manifest.add_vod(fileset["file"], file_dict["duration"])
+                by_height.setdefault(_height(str(fileset["resolution"])), fileset)
+            if by_height:
+                parts.append((by_height, file_dict["duration"]))
+
+        # 구간마다 해상도가 다르면 병합한 영상의 해상도가 도중에 바뀌므로, 모든 구간에 있는 해상도 하나를 고릅니다.
+        # 목표 해상도가 없으면 모든 구간에 공통으로 있는 가장 높은 해상도를 사용합니다.
+        common = set.intersection(*(set(h) for h, _ in parts)) if parts else set()
+        height = target if target in common else max(common, default=None)
+        # 공통 해상도가 하나도 없을 때만 구간별로 가장 높은 해상도를 사용합니다.
+        pairs = [
+            ((by_height.get(height) or by_height[max(by_height)])["file"], duration)
+            for by_height, duration in parts
+        ]
+        manifest.add_vods(pairs)
 
         manifest.set_title(data["title"])
 
@@ -198,3 +248,13 @@ class SOOP:
             raise KeyError("Manifest Empty.")
 
         return manifest
+
+
+def _height(resolution: str) -> int:
+    """
+    "1920x1080" 또는 "1080" 형태의 해상도에서 세로 픽셀 수를 꺼냅니다. 알 수 없으면 0을 반환합니다.
+    """
+    try:
+        return int(resolution.rsplit("x", 1)[-1])
+    except ValueError:
+        return 0
@@ -1,15 +1,24 @@
-import copy
 import shutil
+import threading
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import Annotated
-from rich.progress import Progress
+from rich.progress import Progress, TaskID
 from rich.console import Console
+from rich.text import Text
 import typer
 import json
 import os
 import requests
 import subprocess
+import tempfile
 
-from src.process import download_process, concat_process
+from src.process import (
+    build_header_args,
+    download_process,
+    concat_process,
+    fused_process,
+)
 from src.util import util
 from src.SOOP import SOOP, LoginError
 from src.model import Manifest
@@ -28,6 +37,8 @@ HELP = [
     "|  출력에 사용되는 ffmpeg.exe의 경로를 지정합니다. \n\n|",
     "|  FFmpeg의 -threads 0 옵션을 사용합니다.\n\n|  CPU 사용량이 증가할 수 있습니다.\n\n|",
     "|  배치 모드로 실행합니다. \n\n|  URL을 .txt 파일에서 읽어옵니다.\n\n|  파일 작성법은 README.md를 참고해 주세요.\n\n|",
+    "|  하나의 FFmpeg 프로세스로 모든 구간을 받아 바로 병합합니다.\n\n|  임시 파일을 만들지 않지만, 중단된 다운로드를 이어받을 수 없습니다.\n\n|",
+    "|  동시에 다운로드할 구간의 수를 지정합니다.\n\n|  지정하지 않으면 설정 파일의 parallel 값 또는 3을 사용합니다.\n\n|",
 ]
 
 FFMPEG_ERR = [
@@ -38,6 +49,16 @@ FFMPEG_ERR = [
 
 QUALITY_MAPPING = ["1440p", "1080p", "720p", "540p", "auto"]
 
+# 동시에 다운로드할 구간의 기본 개수
+PARALLEL_JOBS = 3
+
+# 작업 경로 (설정 파일, 임시 폴더, 결과 파일의 기준)
+CWD = os.getcwd()
+CONFIG_PATH = os.path.join(CWD, "config.json")
+# 마지막으로 확인한 FFmpeg 정보는 사용자 설정과 섞이지 않도록 별도의 파일에 저장합니다.
+FFMPEG_CACHE_PATH = os.path.join(CWD, "ffmpeg_cache.json")
+TMP_DIR = os.path.join(CWD, "tmp")
+
 console = Console()
 app = typer.Typer(
     context_settings={"help_option_names": ["-h", "--help"]},
@@ -71,6 +92,14 @@ def main(
         str,
         typer.Option("-b", "--batch", help=HELP[5], show_default=False),
     ] = "",
+    fused: Annotated[
+        bool,
+        typer.Option("-F", "--fused", help=HELP[6], show_default=False, is_flag=True),
+    ] = False,
+    jobs: Annotated[
+        int | None,
+        typer.Option("-j", "--jobs", help=HELP[7], show_default=False, min=1),
+    ] = None,
 ):
     console.print("프로그램을 강제종료하려면 Ctrl+C를 입력하세요.", style="yellow")
     if turbo:
@@ -80,10 +109,10 @@ def main(
     quality = quality.strip().lower()
     if quality not in QUALITY_MAPPING:
         console.print(
-            f"지원하지 않는 품질입니다.\n지원하는 품질: {QUALITY_MAPPING}",
+            f"지원하지 않는 품질입니다.\n지원하는 품질: {QUALITY_MAPPING}\n"
+            "자동으로 최고 품질로 설정합니다.",
             style="yellow",
         )
-        console.print("자동으로 최고 품질로 설정합니다.", style="yellow")
 
     ffmpeg_path = ffmpeg_path.strip().replace("\\", "/")
     ffmpeg_changed = ffmpeg_path != "ffmpeg"
@@ -92,6 +121,7 @@ def main(
         "password": "",
         "second_password": "",
         "ffmpeg_path": ffmpeg_path,
+        "parallel": PARALLEL_JOBS,
     }
 
     try:
@@ -99,12 +129,18 @@ def main(
         if use_config:
             config = handle_config(config)
             ffmpeg_path = config.get("ffmpeg_path")
+        if jobs is None:
+            jobs = int(config.get("parallel", PARALLEL_JOBS))
 
         # Check if ffmpeg_path is valid
         # if invalid, raise Exception with error message
         print()
+        # 설정 파일을 사용하면 마지막으로 확인한 FFmpeg 정보를 저장해 두고 재사용합니다.
+        ffmpeg_cache = load_ffmpeg_cache() if use_config else None
+        cached = dict(ffmpeg_cache or {})
         try:
-            version = check_ffmpeg_path(ffmpeg_path)
+            # 이후 실행하는 FFmpeg는 PATH를 다시 찾지 않도록 확인된 경로를 사용합니다.
+            ffmpeg_path, version = check_ffmpeg_path(ffmpeg_path, ffmpeg_cache)
             if "git" in version:
                 console.print(FFMPEG_ERR[2], style="yellow")
         except ValueError:
@@ -114,6 +150,8 @@ def main(
                 else FFMPEG_ERR[1]
             )
             raise Exception(msg)
+        if ffmpeg_cache is not None and ffmpeg_cache != cached:
+            dump_ffmpeg_cache(ffmpeg_cache)
         # If ffmpeg_path is set & valid, ask to overwrite config
         if ffmpeg_changed and typer.confirm(
             f"FFmpeg 경로 설정이 감지되었습니다. 설정 파일을 덮어쓸까요?"
@@ -151,7 +189,7 @@ def main(
             dump_config(config)
 
         if batch.strip() != "":
-            handle_batch(batch, quality, ffmpeg_path, turbo, version)
+            handle_batch(batch, quality, ffmpeg_path, turbo, version, fused, jobs)
 
         print()
 
@@ -164,7 +202,7 @@ def main(
                 print()
                 continue
 
-            download(manifest, ffmpeg_path, turbo, version)
+            download(manifest, ffmpeg_path, turbo, version, fused, jobs)
 
     # Handle KeyboardInterrupt gracefully
     except KeyboardInterrupt:
@@ -174,30 +212,35 @@ def main(
 
     # If any exception occurs, print the error message and exit
     except Exception as e:
-        console.print(f"{e}", style="red")
-        console.print("프로그램을 종료합니다.", style="red")
+        console.print(f"{e}\n프로그램을 종료합니다.", style="red")
         typer.Exit(code=1)
         return
 
     finally:
-        os.path.exists(os.path.join(os.getcwd(), "tmp")) and shutil.rmtree(
-            os.path.join(os.getcwd(), "tmp")
-        )
+        os.path.exists(TMP_DIR) and shutil.rmtree(TMP_DIR)
 
 
 def handle_batch(
-    batch: str, quality: str, ffmpeg: str, turbo: bool, version: str
+    batch: str,
+    quality: str,
+    ffmpeg: str,
+    turbo: bool,
+    version: str,
+    fused: bool = False,
+    jobs: int = PARALLEL_JOBS,
 ) -> bool:
     if not os.path.exists(batch):
-        console.print(f"파일을 찾을 수 없습니다: {batch}", style="yellow")
-        console.print("배치 모드를 종료합니다.", style="yellow")
+        console.print(
+            f"파일을 찾을 수 없습니다: {batch}\n배치 모드를 종료합니다.", style="yellow"
+        )
         if not typer.confirm("일반 모드로 계속할까요?"):
             typer.Exit(code=0)
             return
 
-    urls = []
-    with open(batch, "r") as f:
-        urls = [url.strip() for url in f.readlines() if url.strip()]
+    # 메모장으로 저장한 파일의 BOM은 첫 URL에 붙지 않도록 제거합니다.
+    with open(batch, "r", encoding="utf-8-sig") as f:
+        lines = f.read().splitlines()
+    urls = [url for url in map(str.strip, lines) if url]
 
     if len(urls) == 0:
         console.print(
@@ -205,27 +248,107 @@ def handle_batch(
             style="yellow",
         )
     else:
-        for url in urls:
-            try:
-                manifest = get_manifest_wrap(url, quality)
-            except ValueError as e:
-                console.print(f"ValueError: {e}", style="yellow")
-                console.print(f"URL이 잘못되었습니다: {url}", style="yellow")
-                console.print("다음 URL로 계속합니다.", style="yellow")
-                continue
-
-            download(manifest, ffmpeg, turbo, version)
+        # 현재 VOD를 받는 동안 다음 VOD의 정보를 미리 요청해 둡니다.
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            pending = executor.submit(SOOP.get_manifest, urls[0], quality)
+            for i, url in enumerate(urls):
+                future = pending
+                if i + 1 < len(urls):
+                    pending = executor.submit(SOOP.get_manifest, urls[i + 1], quality)
+
+                try:
+                    manifest = _wait_result(future)
+                except Exception:
+                    manifest = None
+
+                try:
+                    # 미리 받지 못했다면 다시 요청하면서 오류 내용을 출력합니다.
+                    if manifest is None:
+                        manifest = get_manifest_wrap(url, quality)
+                except ValueError as e:
+                    console.print(
+                        f"ValueError: {e}\nURL이 잘못되었습니다: {url}\n"
+                        "다음 URL로 계속합니다.",
+                        style="yellow",
+                    )
+                    continue
+
+                download(manifest, ffmpeg, turbo, version, fused, jobs)
+        except BaseException:
+            # Ctrl+C로 중단하면 미리 요청한 VOD 정보를 기다리지 않고 바로 종료합니다.
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
         print()
         console.print("배치 다운로드가 완료되었습니다.")
 
     return typer.confirm("일반 모드로 계속할까요?")
 
 
-def dump_config(config: dict[str, str]) -> None:
-    """설정 파일을 현재 작업 디렉토리에 저장합니다."""
+def dump_config(config: dict[str, str], exclusive: bool = False) -> None:
+    """
+    설정 파일을 현재 작업 디렉토리에 저장합니다.
+
+    내용이 같으면 다시 쓰지 않고, 덮어쓸 때는 임시 파일을 교체하여 파일이 잘린 채로 남지 않도록 합니다.
+
+    :param dict config: 저장할 설정 값이 담긴 딕셔너리
+    :param bool exclusive: 설정 파일이 이미 있으면 덮어쓰지 않고 FileExistsError를 발생시킬지 여부
+    """
+    # 사용자가 직접 편집하는 파일이므로 기존과 같은 형식으로 저장합니다.
+    data = json.dumps(config, indent=4).encode("utf-8")
+    if exclusive:
+        with open(CONFIG_PATH, "xb") as f:
+            f.write(data)
+        return
+
+    try:
+        with open(CONFIG_PATH, "rb") as f:
+            if f.read() == data:
+                return
+    except FileNotFoundError:
+        pass
+
+    _replace_file(CONFIG_PATH, data)
+
 
-    with open(os.path.join(os.getcwd(), "config.json"), "w") as f:
-        json.dump(config, f, indent=4)
+def load_ffmpeg_cache() -> dict:
+    """
+    마지막으로 확인한 FFmpeg 정보를 불러옵니다. 저장된 정보가 없거나 읽을 수 없으면 빈 딕셔너리를 반환합니다.
+    """
+    try:
+        with open(FFMPEG_CACHE_PATH, "rb") as f:
+            cache = util.loads_json(f.read())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def dump_ffmpeg_cache(cache: dict) -> None:
+    """
+    확인한 FFmpeg 정보를 저장합니다. 저장에 실패해도 다음 실행에서 다시 확인하면 되므로 무시합니다.
+    """
+    try:
+        _replace_file(FFMPEG_CACHE_PATH, util.dumps_json(cache))
+    except OSError:
+        pass
+
+
+def _replace_file(path: str, data: bytes) -> None:
+    """
+    임시 파일에 기록한 뒤 교체하여, 파일이 잘린 채로 남지 않도록 합니다. 실패하면 임시 파일을 지웁니다.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 def handle_config(default: dict[str, str]) -> dict[str, str]:
@@ -237,25 +360,31 @@ def handle_config(default: dict[str, str]) -> dict[str, str]:
     :return: 설정 파일에서 불러온 설정 값이 담긴 딕셔너리
     """
     print()
-    config_path = os.path.join(os.getcwd(), "config.json")
-    if not os.path.exists(config_path):
-        console.print("설정 파일을 찾을 수 없습니다. 새로 생성합니다.", style="green")
-        try:
-            dump_config(default)
-            console.print("설정 파일을 성공적으로 생성했습니다.", style="green")
-        except Exception as e:
-            console.print(
-                f"설정 파일을 생성하는 중 오류가 발생했습니다: {e}", style="yellow"
-            )
-            if os.path.exists(config_path):
-                os.remove(config_path)
-        finally:
-            return default
+    try:
+        with open(CONFIG_PATH, "rb") as f:
+            config = util.loads_json(f.read())
+    except FileNotFoundError:
+        pass
     else:
-        with open(config_path, "r") as f:
-            config = json.load(f)
-            console.print(f"설정 파일을 성공적으로 불러왔습니다.", style="green")
-            return config
+        console.print(f"설정 파일을 성공적으로 불러왔습니다.", style="green")
+        return config
+
+    console.print("설정 파일을 찾을 수 없습니다. 새로 생성합니다.", style="green")
+    try:
+        dump_config(default, exclusive=True)
+        console.print("설정 파일을 성공적으로 생성했습니다.", style="green")
+    except FileExistsError:
+        # 그 사이에 다른 프로세스가 만든 설정 파일은 건드리지 않습니다.
+        pass
+    except Exception as e:
+        console.print(
+            f"설정 파일을 생성하는 중 오류가 발생했습니다: {e}", style="yellow"
+        )
+        try:
+            os.remove(CONFIG_PATH)
+        except FileNotFoundError:
+            pass
+    return default
 
 
 def download(
@@ -263,6 +392,8 @@ def download(
     ffmpeg_path: str,
     turbo: bool,
     version: str = "7.1.1",
+    fused: bool = False,
+    jobs: int = PARALLEL_JOBS,
 ):
     """
     지정된 해상도를 목표로 다운로드를 시작합니다 .
@@ -272,34 +403,70 @@ def download(
     :param ffmpeg_path: FFmpeg 실행 파일의 경로
     :param turbo: 고성능 모드 활성화 여부
     :param version: FFmpeg 버전 (기본값: "7.1.1")
+    :param fused: 하나의 FFmpeg 프로세스로 다운로드와 병합을 함께 수행할지 여부 (실패하면 구간별로 다시 받음)
+    :param jobs: 동시에 다운로드할 구간의 수
     :raises ProcessError: 중대한 오류가 발생하여 프로그램을 종료해야 하는 경우
     """
 
     print()
-    console.print(f"다운로드를 시작하는 중: ", style="yellow", end="")
-    console.print(manifest.title)
-    console.print("다운로드를 중단하려면 Q를 입력하세요.", style="yellow")
-
-    with Progress() as progress:
-        total_duration, tmp_list = download_parts(
-            progress, ffmpeg_path, manifest, turbo, version
-        )
-
-        path = concat_parts(
-            progress,
-            ffmpeg_path,
+    console.print(
+        Text.assemble(
+            ("다운로드를 시작하는 중: ", "yellow"),
             manifest.title,
-            turbo,
-            tmp_list,
-            total_duration,
+            (
+                "\nCtrl+C를 입력하면 받은 곳까지 저장하고 다운로드를 중단합니다.",
+                "yellow",
+            ),
         )
+    )
 
-        remove_temp_files(progress, tmp_list)
+    # 여러 구간의 진행 상황을 함께 그리므로, 화면 갱신 주기를 낮춰 출력 부담을 줄입니다.
+    with Progress(refresh_per_second=4) as progress:
+        path = None
+        if fused:
+            try:
+                path = download_fused(progress, ffmpeg_path, manifest, turbo, version)
+            except ProcessError as e:
+                console.print(
+                    f"{e}\n구간별 다운로드로 다시 시도합니다.", style="yellow"
+                )
+
+        if path is not None:
+            pass
+        elif manifest.count() == 1:
+            # 구간이 하나뿐이면 병합 없이 최종 파일에 바로 기록합니다.
+            path = _output_path(manifest.title)
+            _, saved = download_parts(
+                progress, ffmpeg_path, manifest, turbo, version, paths=[path]
+            )
+            if not saved:
+                path = None
+        else:
+            total_duration, tmp_list = download_parts(
+                progress, ffmpeg_path, manifest, turbo, version, jobs
+            )
+
+            if tmp_list:
+                path = concat_parts(
+                    progress,
+                    ffmpeg_path,
+                    manifest.title,
+                    tmp_list,
+                    total_duration,
+                )
+
+            remove_temp_files(progress, tmp_list)
         progress.stop()
 
-    console.print()
-    console.print(f"다운로드가 완료되었습니다: ", style="green", end="")
-    console.print(path.replace("\\", "/"), end="\n")
+    if path is None:
+        console.print("\n받은 내용이 없어 저장하지 않았습니다.", style="yellow")
+        return
+
+    console.print(
+        Text.assemble(
+            ("\n다운로드가 완료되었습니다: ", "green"), path.replace("\\", "/")
+        )
+    )
 
 
 def get_credential_input(config: dict[str, str]) -> tuple[str, set[str]]:
@@ -312,7 +479,11 @@ def get_credential_input(config: dict[str, str]) -> tuple[str, set[str]]:
     """
     changed = set()
 
-    prev_conf = copy.deepcopy(config)
+    prev_username, prev_password, prev_second_password = (
+        config.get("username", ""),
+        config.get("password", ""),
+        config.get("second_password", ""),
+    )
 
     config["username"] = typer.prompt("아이디")
     config["password"] = typer.prompt("비밀번호")
@@ -320,11 +491,11 @@ def get_credential_input(config: dict[str, str]) -> tuple[str, set[str]]:
         "2차 비밀번호 (없으면 Enter)", default="", show_default=False
     )
 
-    if config["second_password"] != prev_conf["second_password"]:
+    if config["second_password"] != prev_second_password:
         changed.add("2차 비밀번호")
-    if config["username"] != prev_conf["username"]:
+    if config["username"] != prev_username:
         changed.add("닉네임")
-    if config["password"] != prev_conf["password"]:
+    if config["password"] != prev_password:
         changed.add("비밀번호")
 
     return config, changed
@@ -347,30 +518,58 @@ def try_login(config: dict[str, str]) -> bool:
         return False
 
 
-def check_ffmpeg_path(ffmpeg_path: str) -> int:
+def check_ffmpeg_path(ffmpeg_path: str, cache: dict | None = None) -> tuple[str, str]:
     """
     FFmpeg 경로가 올바른지 확인합니다.
+    실행 파일을 찾을 수 없으면 프로세스를 실행하지 않고 바로 실패합니다.
 
     :param str ffmpeg_path: FFmpeg 실행 파일의 경로
-    :return version: FFmpeg가 설치되어 있을 경우 빌드의 버전을 반환합니다. FFmpeg가 설치되어 있지 않거나 경로가 잘못된 경우 NULL을 반환합니다.
+    :param dict cache: 이전에 확인한 FFmpeg 정보. 실행 파일이 그대로라면 버전 확인을 건너뛰고, 새로 확인하면 갱신됩니다.
+    :return out: 찾은 FFmpeg 실행 파일의 경로와 빌드의 버전
     :raises ValueError: FFmpeg가 설치되어 있지 않거나 경로가 잘못된 경우
     """
+    resolved = shutil.which(ffmpeg_path) or (
+        ffmpeg_path if os.path.isfile(ffmpeg_path) else None
+    )
+    if resolved is None:
+        raise ValueError
+
+    # 실행 파일이 교체되었는지는 수정 시각과 크기로 판단합니다.
+    stat = os.stat(resolved)
+    mtime, size = stat.st_mtime, stat.st_size
+    if (
+        cache is not None
+        and cache.get("version")
+        and cache.get("path") == resolved
+        and cache.get("mtime") == mtime
+        and cache.get("size") == size
+    ):
+        return resolved, cache["version"]
+
+    # 버전에 따라 사용할 수 있는 옵션이 달라지므로, 버전 확인은 한 번 실행합니다.
     try:
         result = subprocess.run(
-            [ffmpeg_path, "-version"],
+            [resolved, "-version"],
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
             check=True,
+            **util.NO_WINDOW,
         )
-        version_info = result.stdout.split("\n")[0]
-        if "ffmpeg" in version_info:
-            if "git" in version_info:
-                return version_info.split(" ")[2]
-            return version_info.split(" ")[2].split("-")[0]
-        else:
-            raise ValueError
-    except (FileNotFoundError, subprocess.CalledProcessError):
+    except (OSError, subprocess.CalledProcessError):
+        raise ValueError
+
+    version_info = result.stdout.split("\n")[0]
+    if "ffmpeg" not in version_info:
         raise ValueError
+    if "git" in version_info:
+        version = version_info.split(" ")[2]
+    else:
+        version = version_info.split(" ")[2].split("-")[0]
+
+    if cache is not None:
+        cache.update(path=resolved, mtime=mtime, size=size, version=version)
+    return resolved, version
 
 
 def download_parts(
@@ -379,91 +578,318 @@ def download_parts(
     manifest: Manifest,
     turbo: bool,
     version: str = "7.1.1",
+    jobs: int = PARALLEL_JOBS,
+    paths: list[str] | None = None,
 ) -> tuple[float, list[str]]:
     """
-    지정된 Manifest의 각 구간을 다운로드합니다.
+    지정된 Manifest의 각 구간을 병렬로 다운로드합니다.
+    중단된 구간이 있으면 이후 구간은 취소하고, 그 구간까지만 반환합니다.
+    Ctrl+C를 입력한 경우에도 같은 방식으로 그때까지 받은 구간만 반환합니다.
 
     :param Progress progress: Rich Progress 객체
     :param str ffmpeg_path: FFmpeg 실행 파일의 경로
     :param Manifest manifest: 다운로드할 Manifest 객체
     :param bool turbo: 고성능 모드 활성화 여부
     :param str version: FFmpeg 버전 (기본값: "7.1.1")
+    :param int jobs: 동시에 다운로드할 구간의 수
+    :param list paths: 구간별 저장 경로 (기본값: tmp 폴더의 임시 파일)
     :return out: 다운로드된 구간의 총 길이 (밀리초 단위)와 임시 파일 목록
     :raises ProcessError: 중대한 오류가 발생하여 프로그램을 종료해야 하는 경우
     """
     session = SOOP.session()
-    i = 0
+    header_args = build_header_args(session)
+    ffprobe_path = _find_ffprobe(ffmpeg_path)
     total_parts = manifest.count()
     total_duration = 0.0
+    title = util.delete_spec_char(manifest.title)
+
+    if paths is None:
+        os.makedirs(TMP_DIR, exist_ok=True)
+
     tmp_list = []
+    tasks = []
+    for i, (_, duration) in enumerate(manifest.items, start=1):
+        if paths is None:
+            # 이름을 고르는 동시에 파일을 만들어 두므로, 기존 파일을 매번 확인할 필요가 없습니다.
+            fd, tmp_path = tempfile.mkstemp(
+                suffix=".mp4", prefix=f"{title}_{i}_", dir=TMP_DIR
+            )
+            os.close(fd)
+            tmp_list.append(tmp_path)
+        else:
+            tmp_list.append(paths[i - 1])
+        tasks.append(
+            progress.add_task(f"{i}/{total_parts}구간 대기 중...", total=duration)
+        )
 
-    for url, duration in manifest.items:
-        i += 1
-        tmp_list.append(
-            tmp_path := util.get_unique_filename(
-                os.path.join(
-                    os.getcwd(), "tmp", f"{util.delete_spec_char(manifest.title)}.mp4"
-                )
+    stop = threading.Event()
+    lock = threading.Lock()
+    procs: list[subprocess.Popen] = []
+    discarded = []
+
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, total_parts))) as executor:
+        futures = [
+            executor.submit(
+                _download_part,
+                progress,
+                tasks[i],
+                f"{i + 1}/{total_parts}",
+                ffmpeg_path,
+                ffprobe_path,
+                url,
+                duration,
+                tmp_list[i],
+                header_args,
+                turbo,
+                version,
+                stop,
+                lock,
+                procs,
+                fragmented=paths is None,
             )
+            for i, (url, duration) in enumerate(manifest.items)
+        ]
+
+        try:
+            # 구간 순서대로 결과를 확인하여, 중단된 구간 이후는 버립니다.
+            for i, future in enumerate(futures):
+                try:
+                    try:
+                        completed, finished = _wait_result(future)
+                    except KeyboardInterrupt:
+                        # Ctrl+C는 FFmpeg에도 전달되어 각 프로세스가 받은 데까지 파일을 정리하고 끝나므로,
+                        # 남은 구간만 취소하고 진행 중인 구간이 끝나기를 기다립니다. 다시 누르면 프로그램을 종료합니다.
+                        _stop_parts(stop, lock, procs, futures, terminate=False)
+                        completed, finished = _wait_result(future)
+                except CancelledError:
+                    # 중단 처리 중에 취소된 구간은 시작되지 않았으므로 받은 내용이 없습니다.
+                    completed, finished = 0.0, False
+                total_duration += completed
+                if not finished:
+                    _stop_parts(stop, lock, procs, futures)
+                    # 받은 내용이 없는 구간은 병합할 수 없으므로 함께 버립니다.
+                    kept = i + 1 if completed else i
+                    discarded = tmp_list[kept:]
+                    tmp_list = tmp_list[:kept]
+                    break
+        except BaseException:
+            _stop_parts(stop, lock, procs, futures)
+            raise
+
+    # 작업 스레드가 모두 끝나 파일이 닫힌 뒤에 지워야 Windows에서 사용 중인 파일을 지우려다 실패하지 않습니다.
+    for part in discarded:
+        try:
+            os.remove(part)
+        except OSError:
+            pass
+
+    return total_duration, tmp_list
+
+
+def _download_part(
+    progress: Progress,
+    task: TaskID,
+    label: str,
+    ffmpeg_path: str,
+    ffprobe_path: str | None,
+    url: str,
+    duration: int,
+    tmp_path: str,
+    header_args: list[str],
+    turbo: bool,
+    version: str,
+    stop: threading.Event,
+    lock: threading.Lock,
+    procs: list[subprocess.Popen],
+    fragmented: bool = True,
+) -> tuple[float, bool]:
+    """
+    구간 하나를 다운로드합니다. 작업 스레드에서 실행됩니다.
+    최종 파일에 바로 기록할 때는 fragmented를 False로 넘겨 일반 MP4로 기록합니다.
+
+    :return out: 다운로드된 길이 (밀리초 단위)와 구간이 끝까지 다운로드되었는지 여부
+    :raises ProcessError: 중대한 오류가 발생하여 프로그램을 종료해야 하는 경우
+    """
+    with lock:
+        if stop.is_set():
+            return 0.0, False
+        progress.update(task, description=f"{label}구간 다운로드 중...")
+        _proc = download_process(
+            ffmpeg_path,
+            url,
+            tmp_path,
+            turbo=turbo,
+            version=version,
+            header_args=header_args,
+            fragmented=fragmented,
         )
+        procs.append(_proc)
 
-        task = progress.add_task(
-            f"{i}/{total_parts}구간 다운로드 중...", total=duration
+    completed = 0
+    for out_time in util.read_out_time(_proc):
+        if out_time == -1:
+            break
+        completed = out_time
+        progress.update(task, completed=completed)
+
+    _proc.wait()
+    returncode = _proc.returncode
+
+    if returncode != 0:
+        progress.update(task, description=f"{label}구간 다운로드 중단", refresh=False)
+        # Ctrl+C를 받은 FFmpeg는 받은 데까지 파일을 정리한 뒤 255로 끝나는데, 메인 스레드가 중단 신호를 설정하기 전에
+        # 이 구간이 먼저 끝날 수 있습니다. 받은 내용이 있는 경우에도 오류로 종료하지 않고 받은 곳까지 반환합니다.
+        if stop.is_set() or returncode == 255 or completed > 0:
+            return completed, False
+        raise ProcessError(
+            "구간 다운로드 중 오류가 발생하였습니다. FFmpeg 경로가 올바른지 확인해 주세요."
         )
-        _proc = download_process(
-            ffmpeg_path, url, tmp_path, session=session, turbo=turbo, version=version
+
+    # 마지막으로 보고된 진행 시간이 곧 받은 길이이므로, 진행 정보가 없을 때만 ffprobe로 확인합니다.
+    vid_len = completed or util.get_duration_ms(tmp_path, ffprobe_path) or 0
+    if vid_len < duration - 160:
+        progress.update(
+            task,
+            description=f"{label}구간 다운로드 중단",
+            refresh=False,
         )
+        return completed, False
+
+    progress.update(
+        task,
+        completed=1,
+        total=1,
+        description=f"{label}구간 다운로드 완료",
+        refresh=False,
+    )
+    return completed, True
+
+
+def _find_ffprobe(ffmpeg_path: str) -> str | None:
+    """
+    FFmpeg와 같은 폴더에 있는 ffprobe의 경로를 찾습니다. 찾을 수 없으면 None을 반환합니다.
+    """
+    # Windows에서는 .exe 확장자까지 확인해야 하므로 shutil.which로 찾습니다.
+    return shutil.which(os.path.join(os.path.dirname(ffmpeg_path), "ffprobe"))
+
 
+def _output_path(title: str) -> str:
+    """
+    작업 경로에 저장할 최종 비디오 파일의 경로를 만듭니다. 같은 이름의 파일이 있으면 번호를 붙입니다.
+    """
+    return util.get_unique_filename(
+        os.path.join(CWD, f"{util.delete_spec_char(title)}.mp4")
+    )
+
+
+def _wait_result(future: Future, interval: float = 0.25):
+    """
+    작업 결과를 짧은 간격으로 나누어 기다립니다.
+    Windows에서는 시간 제한 없는 대기 중에 Ctrl+C가 전달되지 않으므로,
+    메인 스레드가 주기적으로 깨어나 KeyboardInterrupt를 처리할 수 있도록 합니다.
+    """
+    while True:
+        try:
+            return future.result(timeout=interval)
+        except FutureTimeoutError:
+            continue
+
+
+def _stop_parts(
+    stop: threading.Event,
+    lock: threading.Lock,
+    procs: list[subprocess.Popen],
+    futures: list[Future],
+    terminate: bool = True,
+) -> None:
+    """
+    아직 시작하지 않은 구간을 취소하고, 진행 중인 FFmpeg 프로세스를 종료합니다.
+    terminate가 False이면 이미 중단 신호를 받은 프로세스가 스스로 끝나도록 둡니다.
+    """
+    with lock:
+        stop.set()
+        for future in futures:
+            future.cancel()
+        if not terminate:
+            return
+        for proc in procs:
+            proc.poll() is None and proc.terminate()
+
+
+def download_fused(
+    progress: Progress,
+    ffmpeg_path: str,
+    manifest: Manifest,
+    turbo: bool,
+    version: str = "7.1.1",
+) -> str:
+    """
+    하나의 FFmpeg 프로세스로 모든 구간을 받아 최종 파일에 바로 기록합니다.
+    구간별 임시 파일과 병합 과정을 거치지 않습니다.
+
+    :param Progress progress: Rich Progress 객체
+    :param str ffmpeg_path: FFmpeg 실행 파일의 경로
+    :param Manifest manifest: 다운로드할 Manifest 객체
+    :param bool turbo: 고성능 모드 활성화 여부
+    :param str version: FFmpeg 버전 (기본값: "7.1.1")
+    :return path: 다운로드된 비디오 파일의 경로
+    :raises ProcessError: 중대한 오류가 발생하여 프로그램을 종료해야 하는 경우
+    """
+    total_duration = manifest.duration()
+    task = progress.add_task("다운로드 및 병합 중...", total=total_duration)
+    path = _output_path(manifest.title)
+
+    _proc = fused_process(
+        ffmpeg_path,
+        manifest.url_list,
+        path,
+        session=SOOP.session(),
+        turbo=turbo,
+        version=version,
+    )
+
+    completed = 0
+    interrupted = False
+    try:
         for out_time in util.read_out_time(_proc):
             if out_time == -1:
                 break
-            progress.update(task, completed=out_time)
-
-        total_duration += progress._tasks[task].completed
-        _proc.wait()
-        if ffmpeg_path != "ffmpeg":
-            ffprobe_path = os.path.join(os.path.dirname(ffmpeg_path), "ffprobe")
-            if not os.path.exists(ffprobe_path):
-                ffprobe_path = None
-        else:
-            ffprobe_path = "ffprobe"
+            completed = out_time
+            progress.update(task, completed=completed)
+    except KeyboardInterrupt:
+        # Ctrl+C는 FFmpeg에도 전달되므로, 받은 데까지 파일을 정리하고 끝나기를 기다립니다.
+        interrupted = True
 
-        vid_len = (
-            util.get_duration_ms(tmp_path, ffprobe_path)
-            or progress._tasks[task].completed
-        )
-        if _proc.returncode != 0:
-            progress.update(
-                task, description=f"{i}/{total_parts}구간 다운로드 중단", refresh=False
-            )
-            raise ProcessError(
-                "구간 다운로드 중 오류가 발생하였습니다. FFmpeg 경로가 올바른지 확인해 주세요."
-            )
+    _proc.wait()
 
-        if vid_len < duration - 160:
-            progress.update(
-                task,
-                description=f"{i}/{total_parts}구간 다운로드 중단",
-                refresh=False,
-            )
-            break
-        else:
-            progress.update(
-                task,
-                completed=1,
-                total=1,
-                description=f"{i}/{total_parts}구간 다운로드 완료",
-                refresh=False,
-            )
+    if _proc.returncode != 0 and not interrupted:
+        progress.update(task, description="다운로드 중단", refresh=False)
+        # 구간별 다운로드로 다시 시도할 수 있도록 받다 만 파일을 지웁니다.
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        raise ProcessError(
+            "다운로드 중 오류가 발생하였습니다. FFmpeg 경로가 올바른지 확인해 주세요."
+        )
 
-    return total_duration, tmp_list
+    if interrupted or completed < total_duration - 160:
+        progress.update(task, description="다운로드 중단", refresh=False)
+    else:
+        progress.update(
+            task,
+            completed=1,
+            total=1,
+            description="다운로드 완료",
+            refresh=False,
+        )
+    return path
 
 
 def concat_parts(
     progress: Progress,
     ffmpeg_path: str,
     title: str,
-    turbo: bool,
     list: list[str],
     total_duration: float = 0.0,
 ) -> str:
@@ -473,26 +899,25 @@ def concat_parts(
     :param Progress progress: Rich Progress 객체
     :param str ffmpeg_path: FFmpeg 실행 파일의 경로
     :param str title: 최종 비디오 파일의 제목
-    :param bool turbo: 고성능 모드 활성화 여부
     :param list list: 병합할 비디오 파트들의 경로 리스트
     :param float total_duration: 전체 비디오의 총 길이 (밀리초 단위)
     :return path: 병합된 비디오 파일의 경로
     :raises ProcessError: 중대한 오류가 발생하여 프로그램을 종료해야 하는 경우
     """
     task = progress.add_task("영상 합치는 중...", total=total_duration)
-    path = util.get_unique_filename(
-        os.path.join(os.getcwd(), f"{util.delete_spec_char(title)}.mp4")
-    )
+    path = _output_path(title)
 
     try:
-        _proc = concat_process(ffmpeg_path, path, list, turbo=turbo)
+        _proc = concat_process(ffmpeg_path, path, list)
     except Exception as e:
         raise ProcessError("영상을 병합하는 중 오류가 발생하였습니다.")
 
+    completed = 0
     for out_time in util.read_out_time(_proc):
         if out_time == -1:
             break
-        progress.update(task, completed=out_time)
+        completed = out_time
+        progress.update(task, completed=completed)
 
     _proc.wait()
     if _proc.returncode != 0:
@@ -501,17 +926,18 @@ def concat_parts(
             "영상 병합 중 오류가 발생하였습니다. FFmpeg 경로가 올바른지 확인해 주세요."
         )
 
-    if progress._tasks[task].completed < total_duration - 1:
+    if completed < total_duration - 1:
         progress.update(task, description="영상 병합 중단", refresh=False)
     else:
         progress.update(
             task,
             completed=100,
             total=100,
-            description=f"영상 병합 완료",
+            description="영상 병합 완료",
             refresh=False,
         )
-        return path
+    # 병합된 길이가 모자라도 만들어진 파일은 그대로 돌려주어, 사용자가 결과를 확인할 수 있도록 합니다.
+    return path
 
 
 def remove_temp_files(progress: Progress, tmp_list: list[str]):
@@ -522,20 +948,32 @@ def remove_temp_files(progress: Progress, tmp_list: list[str]):
     :param list tmp_list: 제거할 임시 파일 목록
     """
     task = progress.add_task("임시 파일 정리 중...", total=len(tmp_list))
-    try:
-        for part in tmp_list:
-            os.remove(part)
+    errors = []
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(os.remove, part) for part in tmp_list]
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                errors.append(e)
             progress.update(task, advance=1)
+
+    if errors:
+        progress.update(task, description="임시 파일 정리 실패", refresh=False)
+        console.print(
+            f"임시 파일 제거 중 오류가 발생하였습니다: {errors[0]}\n"
+            "/tmp 폴더의 임시 파일을 직접 제거해 주세요.",
+            style="yellow",
+        )
+    else:
         progress.update(
             task,
             completed=len(tmp_list),
             description="임시 파일 정리 완료",
             refresh=False,
         )
-    except OSError as e:
-        progress.update(task, description="임시 파일 정리 실패", refresh=False)
-        console.print(f"임시 파일 제거 중 오류가 발생하였습니다: {e}", style="yellow")
-        console.print("/tmp 폴더의 임시 파일을 직접 제거해 주세요.", style="yellow")
 
 
 def get_url_input(quality_d: str | None = "auto"):
@@ -557,17 +995,19 @@ def get_url_input(quality_d: str | None = "auto"):
     if url == "":
         raise KeyboardInterrupt
 
-    if len(url.split(maxsplit=1)) < 2:
+    parts = url.split()
+    if len(parts) < 2:
         return url, quality_d
 
-    if url.split()[1] in QUALITY_MAPPING:
-        return url.split()[0], url.split()[1]
+    quality = parts[1].lower()
+    if quality in QUALITY_MAPPING:
+        return parts[0], quality
 
     console.print(
         f"지원하지 않는 품질입니다.\n지원하는 품질: {QUALITY_MAPPING}",
         style="yellow",
     )
-    return url.split()[0], quality_d
+    return parts[0], quality_d
 
 
 def get_manifest_wrap(url: str, quality: str) -> Manifest:
@@ -581,19 +1021,24 @@ def get_manifest_wrap(url: str, quality: str) -> Manifest:
     try:
         return SOOP.get_manifest(url, quality)
     except ValueError as e:
-        console.print(f"ValueError: {e}", style="yellow")
-        console.print("SOOP VOD 플레이어 URL이 맞는지 확인해 주세요.", style="yellow")
+        console.print(
+            f"ValueError: {e}\nSOOP VOD 플레이어 URL이 맞는지 확인해 주세요.",
+            style="yellow",
+        )
         raise e
     except KeyError as e:
-        console.print(f"VOD 정보가 잘못되었습니다: {e}", style="red")
         console.print(
-            "존재하지 않는 VOD이거나, 접근권한이 없을 수 있습니다.", style="red"
+            f"VOD 정보가 잘못되었습니다: {e}\n"
+            "존재하지 않는 VOD이거나, 접근권한이 없을 수 있습니다.\n"
+            "로그인 상태와 본인인증 여부를 확인해 주세요.",
+            style="red",
         )
-        console.print("로그인 상태와 본인인증 여부를 확인해 주세요.", style="red")
         raise e
     except requests.exceptions.RequestException as e:
-        console.print(f"정보를 불러오는 중 오류가 발생했습니다: {e}", style="red")
-        console.print("네트워크 연결을 확인해주세요.", style="red")
+        console.print(
+            f"정보를 불러오는 중 오류가 발생했습니다: {e}\n네트워크 연결을 확인해주세요.",
+            style="red",
+        )
         raise e
 
 
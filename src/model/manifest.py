@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from typing import Iterator
 from src.model import Types
 
 
@@ -26,11 +27,20 @@ class Manifest:
         self.url_list.append(url)
         self.duration_list.append(duration)
 
+    def add_vods(self, items: list[tuple[Types.player_url, Types.duration]]):
+        """
+        매니페스트에 여러 VOD를 한 번에 추가합니다.
+
+        :param items: VOD의 URL과 길이 (밀리초 단위) 튜플의 리스트
+        """
+        self.url_list.extend(url for url, _ in items)
+        self.duration_list.extend(duration for _, duration in items)
+
     def count(self) -> int:
         """
         매니페스트에 포함된 VOD의 개수를 반환합니다.
         """
-        return min(len(self.duration_list), len(self.url_list))
+        return len(self.url_list)
 
     def is_empty(self) -> bool:
         """
@@ -45,8 +55,8 @@ class Manifest:
         return sum(self.duration_list)
 
     @property
-    def items(self) -> list[tuple[Types.url, Types.duration]]:
+    def items(self) -> Iterator[tuple[Types.url, Types.duration]]:
         """
-        URL과 Duration의 튜플 리스트를 반환합니다.
+        URL과 Duration의 튜플을 차례로 반환합니다. 접근할 때마다 새로 순회합니다.
         """
-        return list(zip(self.url_list, self.duration_list))
+        return zip(self.url_list, self.duration_list)
@@ -1,56 +1,35 @@
-from dataclasses import dataclass
-import urllib.parse
+import re
+
+# VOD 플레이어 주소와 그 뒤에 오는 고유번호 (m.vod 등 하위 도메인과, player 앞에 다른 경로가 있는 주소도 허용합니다.)
+_PLAYER_URL_RE = re.compile(
+    r"^(?:https?://)?(?:[^/?#]+\.)?vod\.sooplive\.co\.kr(?::\d+)?/(?:[^?#]*?/)??player(?:/([^/?#]*))?(?:[/?#]|$)",
+    re.IGNORECASE,
+)
 
 
 class Types:
     class title(str): ...
 
-    @dataclass
-    class url:
-        def __init__(self, value: str):
-            parsed = urllib.parse.urlparse(value)
-            self.__netloc = parsed.netloc
-            self.__path = parsed.path
-            self.__path_parts = parsed.path.split("/")
-
-        @property
-        def netloc(self) -> str:
-            return self.__netloc
-
-        @property
-        def path(self) -> str:
-            return self.__path
+    class url(str):
+        def __new__(cls, value: str):
+            return super().__new__(cls, value.strip())
 
-        @property
-        def path_parts(self) -> list[str]:
-            return self.__path_parts
-
-    @dataclass
     class player_url(url):
-        __title_no: int = None
-
-        def __init__(self, value: str):
-            super().__init__(value)
-            self.__validate__()
+        def __new__(cls, value: str):
+            self = super().__new__(cls, value)
+            match = _PLAYER_URL_RE.match(self)
+            if match is None:
+                raise ValueError("유효하지 않은 URL입니다.")
             try:
-                player_idx = self.path_parts.index("player")
-                self.__title_no = int(self.path_parts[player_idx + 1])
-            except (ValueError, IndexError):
+                self.__title_no = int(match.group(1))
+            except (TypeError, ValueError):
                 raise ValueError("VOD 고유번호를 찾을 수 없습니다.")
-
-        def __validate__(self) -> None:
-            """유효한 player_url인지 확인합니다."""
-            if (
-                "player" not in self.path_parts
-                or "vod.sooplive.co.kr" not in self.netloc
-            ):
-                raise ValueError("유효하지 않은 URL입니다.")
+            return self
 
         @property
         def title_no(self) -> int:
             return self.__title_no
 
-    @dataclass
     class vod_url(url): ...
 
     class duration(int): ...
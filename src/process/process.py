@@ -1,9 +1,77 @@
 import os
 import subprocess
 import sys
-from time import time
 import requests
 
+# HTTP 연결을 재사용하고, 일시적인 연결 끊김에서 복구하도록 하는 입력 옵션
+HTTP_ARGS = [
+    "-multiple_requests",
+    "1",
+    "-reconnect",
+    "1",
+    "-reconnect_streamed",
+    "1",
+    "-reconnect_delay_max",
+    "5",
+    # 응답 없이 멈춘 연결은 15초 뒤에 끊어 재연결하도록 합니다.
+    "-rw_timeout",
+    "15000000",
+]
+
+# 진행 상황을 표준 출력으로 1초마다 보고하고, 오류만 표시하도록 하는 공통 옵션
+PROGRESS_ARGS = (
+    "-v",
+    "error",
+    "-nostats",
+    "-progress",
+    "pipe:1",
+    "-stats_period",
+    "1",
+)
+
+# 표준 입력으로 받은 concat 목록을 읽어 스트림을 복사하는 공통 옵션
+CONCAT_INPUT_ARGS = (
+    "-f",
+    "concat",
+    "-safe",
+    "0",
+    "-i",
+    "pipe:0",
+    "-c",
+    "copy",
+)
+
+# 고성능 모드에서 FFmpeg가 사용할 스레드 수를 자동으로 정하도록 합니다.
+TURBO_ARGS = ("-threads", "0")
+
+
+def _session_headers(session: requests.Session) -> list[tuple[str, str]]:
+    """
+    세션의 헤더와 쿠키로 FFmpeg에 전달할 HTTP 헤더 목록을 만듭니다.
+    """
+    headers = [
+        (k, v)
+        for k, v in session.headers.items()
+        if k.lower() not in ["content-length", "content-encoding", "accept-encoding"]
+    ]
+    # 영상은 이미 압축되어 있으므로 전송 압축을 요청하지 않습니다.
+    headers.append(("Accept-Encoding", "identity"))
+    cookies = session.cookies.get_dict()
+    if cookies:
+        headers.append(("Cookie", "; ".join(f"{k}={v}" for k, v in cookies.items())))
+    return headers
+
+
+def build_header_args(session: requests.Session) -> list[str]:
+    """
+    세션의 헤더와 쿠키로 FFmpeg의 -headers 인자를 만듭니다.
+    한 VOD의 구간들은 같은 헤더를 사용하므로, 다운로드마다 한 번만 만들어 재사용합니다.
+    """
+    lines = [f"{k}: {v}\r\n" for k, v in _session_headers(session)]
+
+    # FFmpeg는 마지막 -headers 값만 사용하므로, 모든 헤더를 CRLF로 이어 한 번에 전달합니다.
+    return ["-headers", "".join(lines)] if lines else []
+
 
 def download_process(
     ffmpeg_path: str,
@@ -12,64 +80,57 @@ def download_process(
     session: requests.Session | None = None,
     turbo: bool = False,
     version: str = "7.1.1",
+    header_args: list[str] | None = None,
+    fragmented: bool = True,
 ) -> subprocess.Popen:
     """
     다운로드 프로세스를 생성하여 반환합니다.
+    저장 경로의 폴더는 호출하는 쪽에서 미리 만들어 두어야 합니다.
+    header_args가 주어지지 않으면 세션으로부터 만듭니다.
+    fragmented가 False이면 병합을 거친 결과와 같은 일반 MP4(faststart)로 기록하므로, 최종 파일에 바로 기록할 때 사용합니다.
     """
-    headers = {}
-    if session is None:
-        session = requests.Session()
-    cookies = session.cookies.get_dict()
-    if not os.path.exists(os.path.dirname(path)):
-        os.makedirs(os.path.dirname(path))
-
-    for k, v in session.headers.items():
-        if k.lower() not in ["content-length", "content-encoding"]:
-            headers[k] = v
-
-    header_args = []
-    for k, v in headers.items():
-        header_args.extend(["-headers", f"{k}: {v}"])
-    for k, v in cookies.items():
-        header_args.extend(["-headers", f"Cookie: {k}={v}"])
+    if header_args is None:
+        header_args = build_header_args(session or requests.Session())
 
     ffmpeg_cmd = [
         ffmpeg_path,
+        "-nostdin",
         *header_args,
+        *HTTP_ARGS,
         "-i",
         url,
         "-c",
         "copy",
+        # 임시 구간은 조각 단위로 기록하여, 중단되어도 받은 데까지 읽을 수 있도록 합니다.
         "-movflags",
-        "faststart+frag_keyframe",
+        "frag_keyframe" if fragmented else "faststart",
         "-f",
         "mp4",
-        "-v",
-        "error",
-        # "-stats",
-        "-progress",
-        "pipe:1",
+        # 구간 파일은 미리 만들어 둔 자리에 덮어씁니다.
+        "-y",
+        *PROGRESS_ARGS,
     ]
 
     if turbo:
-        ffmpeg_cmd.append("-threads")
-        ffmpeg_cmd.append("0")
+        ffmpeg_cmd.extend(TURBO_ARGS)
 
-    if "git" not in version:
-        if int(version.split(".")[0]) >= 7 and int(version.split(".")[1]) >= 1:
-            ffmpeg_cmd.insert(1, "0")
-            ffmpeg_cmd.insert(1, "-extension_picky")
-            ffmpeg_cmd.insert(1, "ALL")
-            ffmpeg_cmd.insert(1, "-allowed_extensions")
+    if _supports_extension_picky(version):
+        ffmpeg_cmd.insert(1, "0")
+        ffmpeg_cmd.insert(1, "-extension_picky")
+        ffmpeg_cmd.insert(1, "ALL")
+        ffmpeg_cmd.insert(1, "-allowed_extensions")
 
     ffmpeg_cmd.append(path)
 
+    # 여러 구간을 동시에 받으므로 콘솔 입력은 넘기지 않습니다.
+    # 프로세스마다 터미널 설정을 저장하고 되돌리면서 순서가 꼬이면 이후 입력이 보이지 않을 수 있습니다.
     return subprocess.Popen(
         ffmpeg_cmd,
-        stdin=sys.stdin,
+        stdin=subprocess.DEVNULL,
         stdout=subprocess.PIPE,
         stderr=sys.stderr,
-        text=True,
+        # read_out_time이 파이프를 os.read로 직접 읽으므로 파이썬 쪽 버퍼는 두지 않습니다.
+        bufsize=0,
     )
 
 
@@ -77,48 +138,131 @@ def concat_process(
     ffmpeg_path: str,
     export_path: str,
     part_list: list[str],
-    turbo: bool = False,
 ) -> subprocess.Popen:
     """
     병합 프로세스를 생성하고 반환합니다.
+    concat 목록은 임시 파일 없이 표준 입력으로 전달합니다.
+    스트림을 복사만 하므로 고성능 모드의 영향을 받지 않습니다.
     """
-    tmp_path = os.path.join(os.getcwd(), "tmp", f"list_{time()}.txt")
-    with open(tmp_path, "w", encoding="utf-8") as tmp:
-        for part in part_list:
-            tmp.write(f"file '{part}'\n")
+    # 목록을 pipe:0으로 읽으면 경로가 pipe: 기준으로 해석되므로, file: 프로토콜을 붙여 로컬 파일로 엽니다.
+    concat_list = "".join(
+        f"file 'file:{_escape_concat_path(os.path.abspath(part))}'\n"
+        for part in part_list
+    )
 
     concat_cmd = [
         ffmpeg_path,
-        "-f",
-        "concat",
-        "-safe",
-        "0",
-        "-i",
-        tmp_path,
-        "-c",
-        "copy",
-        "-threads",
-        "0",
+        "-protocol_whitelist",
+        "file,pipe",
+        *CONCAT_INPUT_ARGS,
+        *TURBO_ARGS,
         "-y",
-        "-v",
-        "error",
         "-movflags",
         "faststart",
-        # "-stats",
-        "-progress",
-        "pipe:1",
+        *PROGRESS_ARGS,
         export_path,
     ]
 
-    if turbo:
-        concat_cmd.append("-threads")
-        concat_cmd.append("0")
-
-    return subprocess.Popen(
+    proc = subprocess.Popen(
         concat_cmd,
-        stdin=sys.stdin,
+        stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
         stderr=sys.stderr,
         # stderr=subprocess.STDOUT,
-        text=True,
+        bufsize=0,
+    )
+    _write_stdin(proc, concat_list)
+    return proc
+
+
+def fused_process(
+    ffmpeg_path: str,
+    url_list: list[str],
+    export_path: str,
+    session: requests.Session | None = None,
+    turbo: bool = False,
+    version: str = "7.1.1",
+) -> subprocess.Popen:
+    """
+    원격 구간들을 하나의 FFmpeg 프로세스로 받아 바로 병합하는 프로세스를 생성합니다.
+    구간마다 필요한 HTTP 옵션은 concat 목록의 option 지시어로 전달합니다.
+
+    concat 목록은 줄 단위로 읽으므로 option 값에 줄바꿈을 넣을 수 없어, headers 옵션에는 헤더를 한 줄만 담을 수 있습니다.
+    User-Agent와 Referer는 전용 옵션으로 전달하고, 남은 헤더 중에서는 인증에 필요한 쿠키를 우선합니다.
+    전달하지 못한 헤더 때문에 요청이 거부되면, 호출하는 쪽에서 구간별 다운로드로 다시 시도합니다.
+    """
+    if session is None:
+        session = requests.Session()
+
+    headers = dict(_session_headers(session))
+    options = []
+    for key, header in (("user_agent", "User-Agent"), ("referer", "Referer")):
+        if headers.get(header):
+            options.append((key, headers.pop(header)))
+    # FFmpeg가 스스로 보내는 헤더는 뺍니다. Accept-Encoding은 보내지 않으므로 전송 압축도 요청되지 않습니다.
+    for header in ("Accept", "Connection", "Accept-Encoding"):
+        headers.pop(header, None)
+    if headers:
+        key = "Cookie" if "Cookie" in headers else next(iter(headers))
+        options.append(("headers", f"{key}: {headers[key]}"))
+    for i in range(0, len(HTTP_ARGS), 2):
+        options.append((HTTP_ARGS[i].lstrip("-"), HTTP_ARGS[i + 1]))
+    if _supports_extension_picky(version):
+        options.append(("allowed_extensions", "ALL"))
+        options.append(("extension_picky", "0"))
+
+    lines = ["ffconcat version 1.0\n"]
+    for url in url_list:
+        lines.append(f"file '{_escape_concat_path(url)}'\n")
+        lines.extend(f"option {k} '{_escape_concat_path(v)}'\n" for k, v in options)
+
+    fused_cmd = [
+        ffmpeg_path,
+        "-protocol_whitelist",
+        "file,pipe,http,https,tcp,tls,crypto",
+        *CONCAT_INPUT_ARGS,
+        "-y",
+        "-movflags",
+        "faststart",
+        *PROGRESS_ARGS,
+    ]
+
+    if turbo:
+        fused_cmd.extend(TURBO_ARGS)
+
+    fused_cmd.append(export_path)
+
+    proc = subprocess.Popen(
+        fused_cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=sys.stderr,
+        bufsize=0,
     )
+    _write_stdin(proc, "".join(lines))
+    return proc
+
+
+def _escape_concat_path(path: str) -> str:
+    """
+    concat 목록의 작은따옴표 안에 넣을 수 있도록 경로나 옵션 값의 작은따옴표를 이스케이프합니다.
+    목록을 표준 입력으로 넘기면 상대 경로의 기준이 사라지므로, 호출하는 쪽에서 절대 경로를 넘겨야 합니다.
+    """
+    return path.replace("'", "'\\''")
+
+
+def _write_stdin(proc: subprocess.Popen, text: str) -> None:
+    """프로세스의 표준 입력에 문자열을 쓰고 닫습니다."""
+    try:
+        proc.stdin.write(text.encode("utf-8"))
+        proc.stdin.close()
+    except BrokenPipeError:
+        # FFmpeg가 먼저 종료된 경우, 오류는 종료 코드로 확인합니다.
+        pass
+
+
+def _supports_extension_picky(version: str) -> bool:
+    """HLS 확장자 검사 옵션(-extension_picky)을 지원하는 FFmpeg 버전인지 확인합니다."""
+    if "git" in version:
+        return False
+    return int(version.split(".")[0]) >= 7 and int(version.split(".")[1]) >= 1
@@ -1,7 +1,18 @@
+import json
 import os
-import re
 import subprocess
-from typing import Generator
+from typing import Any, Generator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 출력을 직접 읽는 보조 프로세스가 Windows에서 콘솔 창을 만들지 않도록 하는 옵션
+NO_WINDOW = {"creationflags": subprocess.CREATE_NO_WINDOW} if os.name == "nt" else {}
+
+# 파일명으로 사용할 수 없는 특수문자와 제어 문자
+_SPEC_TABLE = str.maketrans("", "", '\\/:*?"<>|' + "".join(map(chr, range(32))))
 
 
 def get_unique_filename(file_path: str) -> str:
@@ -14,39 +25,52 @@ def get_unique_filename(file_path: str) -> str:
 
     name = delete_spec_char(name)
 
+    # 디렉토리를 한 번만 읽어, 후보 이름마다 파일 시스템을 조회하지 않습니다.
+    try:
+        with os.scandir(directory or ".") as entries:
+            existing = {os.path.normcase(entry.name) for entry in entries}
+    except FileNotFoundError:
+        return file_path
+
+    if os.path.normcase(filename) not in existing:
+        return file_path
+
     counter = 1
-    unique_path = file_path
-    while os.path.exists(unique_path):
-        unique_path = os.path.join(directory, f"{name}({counter}){ext}")
+    while os.path.normcase(f"{name}({counter}){ext}") in existing:
         counter += 1
 
-    return unique_path
+    return os.path.join(directory, f"{name}({counter}){ext}")
 
 
 def delete_spec_char(string: str):
-    return re.sub(r'[\/:*?"<>|]', "", string)
+    return string.translate(_SPEC_TABLE)
 
 
 def read_out_time(proc: subprocess.Popen) -> Generator[int, None, None]:
     """
     FFmpeg 프로세스의 stdout에서 out_time_ms 값을 읽어 밀리초 단위로 반환합니다.
+    파이프를 블록 단위로 읽고, 진행 시간과 종료 여부 외의 항목은 해석하지 않습니다.
     """
+    fd = proc.stdout.fileno()
+    buffer = b""
     while True:
-        line: str = proc.stdout.readline()
-        line = line.strip()
-        if not line:
-            yield -1
-            break
-        if "error" in line.lower():
-            yield -1
-            break
-        if line.startswith("out_time_ms"):
-            out_time = int(line.split("=")[1]) // 1000
-            yield out_time
-        elif line.startswith("progress") and "end" in line:
+        chunk = os.read(fd, 4096)
+        if not chunk:
             yield -1
             break
 
+        *lines, buffer = (buffer + chunk).split(b"\n")
+        for line in lines:
+            if line.startswith(b"out_time_ms="):
+                try:
+                    out_time = int(line[12:]) // 1000
+                except ValueError:
+                    continue
+                yield out_time
+            elif line.startswith(b"progress=end") or b"error" in line.lower():
+                yield -1
+                return
+
 
 def get_duration_ms(input_path, ffprobe_path="ffprobe") -> int:
     try:
@@ -63,11 +87,31 @@ def get_duration_ms(input_path, ffprobe_path="ffprobe") -> int:
                 "default=noprint_wrappers=1:nokey=1",
                 input_path,
             ],
+            stdin=subprocess.DEVNULL,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
+            **NO_WINDOW,
         )
         seconds = float(result.stdout.strip())
     except:
         return None
     return int(seconds * 1000)
+
+
+def loads_json(data: bytes | str) -> Any:
+    """
+    JSON 문자열을 파싱합니다. orjson이 설치되어 있으면 orjson을 사용합니다.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(obj: Any) -> bytes:
+    """
+    객체를 들여쓰기된 JSON 바이트열로 직렬화합니다. orjson이 설치되어 있으면 orjson을 사용합니다.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")